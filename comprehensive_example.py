@@ -1,11 +1,20 @@
 from dushy_redis_lib import DushyRedisClient
 import time
-from datetime import datetime
 import json
 
+# Timestamp cache for log(): the formatted string only changes once per
+# second, so reformat lazily instead of building a datetime per call
+_last_sec = 0
+_last_str = ''
+
 def log(message):
     """Helper to print timestamped messages"""
-    print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+    global _last_sec, _last_str
+    now = int(time.time())
+    if now != _last_sec:
+        _last_sec = now
+        _last_str = time.strftime('%H:%M:%S', time.localtime(now))
+    print(f"[{_last_str}] {message}")
 
 def handle_string_messages(message):
     log(f"Received string message: {message}")
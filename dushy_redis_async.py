@@ -0,0 +1,222 @@
+import asyncio
+from typing import Any, List, Callable, Dict, Optional
+from base64 import b64encode
+
+from dushy_redis_lib import _dumps, _loads
+from dushy_redis_parser import Parser
+
+
+class AsyncDushyRedisClient:
+    """
+    Asyncio variant of the client for the Redis-clone server.
+
+    Instead of a dedicated reader thread with a blocking recv, a single
+    reader task drives the connection on the event loop and resolves
+    responses in order, so commands simply await their reply.
+
+    Example usage:
+        client = await AsyncDushyRedisClient.connect()
+        await client.set("key", "value")
+        value = await client.get("key")
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 6379):
+        self.host = host
+        self.port = port
+        self.subscriptions: Dict[str, List[Callable]] = {}
+        self.running = False
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._responses: 'asyncio.Queue[str]' = asyncio.Queue()
+        self._parser = Parser()
+        self._read_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    async def connect(cls, host: str = '127.0.0.1',
+                      port: int = 6379) -> 'AsyncDushyRedisClient':
+        """
+        Creates and connects a new async client instance.
+
+        Args:
+            host: Server hostname
+            port: Server port
+
+        Returns:
+            Connected AsyncDushyRedisClient instance
+        """
+        client = cls(host, port)
+        await client._connect()
+        return client
+
+    async def _connect(self) -> None:
+        self._reader, self._writer = await asyncio.open_connection(
+            self.host, self.port)
+        self.running = True
+        self._read_task = asyncio.create_task(self._read_responses())
+
+    async def _read_responses(self) -> None:
+        feed = self._parser.feed
+        while self.running:
+            try:
+                data = await self._reader.read(4096)
+                if not data:
+                    break
+
+                for channel, payload, is_binary in feed(data):
+                    if channel is None:
+                        self._responses.put_nowait(
+                            payload.strip().decode('utf-8'))
+                        continue
+
+                    # Handle pub/sub messages
+                    try:
+                        if is_binary:
+                            content = payload
+                        else:
+                            message = _loads(payload)
+                            content = message['Content']
+                            if message['Type'] == 2:  # BinaryMessage
+                                content = bytes(content)
+
+                        channel = channel.decode('utf-8')
+                        if channel in self.subscriptions:
+                            for callback in self.subscriptions[channel]:
+                                result = callback(content)
+                                if asyncio.iscoroutine(result):
+                                    await result
+                    except Exception as e:
+                        print(f"Error processing message: {e}")
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                print(f"Read error: {e}")
+                break
+
+    async def _send_command(self, command: str) -> str:
+        """Sends a command and awaits the response."""
+        self._writer.write(command.encode('utf-8') + b'\n')
+        await self._writer.drain()
+        return await self._responses.get()
+
+    async def set(self, key: str, value: Any) -> bool:
+        """Sets a key-value pair."""
+        if isinstance(value, str):
+            value = f'"{value}"'
+        response = await self._send_command(f"SET {key} {value}")
+        return response == "OK"
+
+    async def get(self, key: str) -> Optional[str]:
+        """Gets a value by key."""
+        response = await self._send_command(f"GET {key}")
+        return None if response == "(nil)" else response
+
+    async def lpush(self, key: str, values: List[Any]) -> int:
+        """Pushes values to the left of a list."""
+        response = await self._send_command(
+            f"LPUSH {key} {' '.join(map(str, values))}")
+        return int(response)
+
+    async def rpush(self, key: str, values: List[Any]) -> int:
+        """Pushes values to the right of a list."""
+        response = await self._send_command(
+            f"RPUSH {key} {' '.join(map(str, values))}")
+        return int(response)
+
+    async def lpop(self, key: str) -> Optional[str]:
+        """Pops a value from the left of a list."""
+        response = await self._send_command(f"LPOP {key}")
+        return None if response == "(nil)" else response
+
+    async def rpop(self, key: str) -> Optional[str]:
+        """Pops a value from the right of a list."""
+        response = await self._send_command(f"RPOP {key}")
+        return None if response == "(nil)" else response
+
+    async def sadd(self, key: str, members: List[Any]) -> int:
+        """Adds members to a set."""
+        response = await self._send_command(
+            f"SADD {key} {' '.join(map(str, members))}")
+        return int(response)
+
+    async def smembers(self, key: str) -> Optional[List[str]]:
+        """Gets all members of a set."""
+        response = await self._send_command(f"SMEMBERS {key}")
+        return None if response == "(nil)" else response.split()
+
+    async def hset(self, key: str, field: str, value: Any) -> bool:
+        """Sets a field in a hash."""
+        response = await self._send_command(f"HSET {key} {field} {value}")
+        return response == "OK"
+
+    async def hget(self, key: str, field: str) -> Optional[str]:
+        """Gets a field from a hash."""
+        response = await self._send_command(f"HGET {key} {field}")
+        return None if response == "(nil)" else response
+
+    async def subscribe(self, channel: str,
+                        callback: Callable[[Any], Any]) -> bool:
+        """
+        Subscribes to a channel.
+
+        Args:
+            channel: Channel name
+            callback: Function (sync or async) to call when messages
+                are received
+        """
+        if channel not in self.subscriptions:
+            self.subscriptions[channel] = []
+        self.subscriptions[channel].append(callback)
+        response = await self._send_command(f"SUBSCRIBE {channel}")
+        return response == "OK"
+
+    async def publish(self, channel: str, message: str) -> bool:
+        """Publishes a string message to a channel."""
+        response = await self._send_command(f"PUBLISH {channel} {message}")
+        return response == "OK"
+
+    async def publish_json(self, channel: str, data: Any) -> bool:
+        """Publishes JSON data to a channel."""
+        json_str = _dumps(data)
+        response = await self._send_command(
+            f"PUBLISH_JSON {channel} {json_str}")
+        return response == "OK"
+
+    async def publish_int(self, channel: str, number: int) -> bool:
+        """Publishes an integer to a channel."""
+        response = await self._send_command(f"PUBLISH_INT {channel} {number}")
+        return response == "OK"
+
+    async def publish_binary(self, channel: str, data: bytes) -> bool:
+        """Publishes binary data to a channel."""
+        encoded = b64encode(data).decode('utf-8')
+        response = await self._send_command(f"PUBLISH_BIN {channel} {encoded}")
+        return response == "OK"
+
+    async def publish_binary_raw(self, channel: str, data: bytes) -> bool:
+        """
+        Publishes binary data with length-prefixed framing (no base64).
+
+        See DushyRedisClient.publish_binary_raw for the protocol details.
+        """
+        header = f"PUBLISH_BIN {channel} {len(data)}\n".encode('utf-8')
+        self._writer.write(header + data)
+        await self._writer.drain()
+        response = await self._responses.get()
+        return response == "OK"
+
+    async def publish_array(self, channel: str, array: List[Any]) -> bool:
+        """Publishes an array to a channel."""
+        json_arr = _dumps(array)
+        response = await self._send_command(
+            f"PUBLISH_ARRAY {channel} {json_arr}")
+        return response == "OK"
+
+    async def close(self) -> None:
+        """Closes the connection."""
+        self.running = False
+        if self._read_task is not None:
+            self._read_task.cancel()
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
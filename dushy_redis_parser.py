@@ -0,0 +1,88 @@
+"""
+Incremental line parser for the DushyRedis wire protocol.
+
+Lives in its own module so the hot receive path can be compiled: the code
+uses only constructs that `cythonize dushy_redis_parser.py` handles as-is,
+and a built extension placed alongside this file shadows the pure-Python
+version on import.
+"""
+
+from typing import List, Optional, Tuple
+
+# Pub/sub frame prefixes, matched by slice comparison
+_MSG_PREFIX = b'Message '
+_MSG_PREFIX_LEN = len(_MSG_PREFIX)
+_BIN_PREFIX = b'MessageBin '
+_BIN_PREFIX_LEN = len(_BIN_PREFIX)
+
+
+class Parser:
+    """
+    Splits raw socket bytes into protocol frames.
+
+    feed() consumes one chunk and returns the frames it completed as
+    (channel, payload, is_binary) tuples: JSON pub/sub messages carry
+    their payload bytes with is_binary False, length-prefixed
+    `MessageBin <channel> <len>` frames carry raw bytes with is_binary
+    True, and plain command responses have channel None. Partial frames
+    stay buffered until the next chunk.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._bin_channel: Optional[bytes] = None
+        self._bin_remaining = 0
+
+    def feed(self, data: bytes) -> List[Tuple[Optional[bytes], bytes, bool]]:
+        buffer = self._buffer
+        buffer.extend(data)
+        events: List[Tuple[Optional[bytes], bytes, bool]] = []
+        while True:
+            if self._bin_channel is not None:
+                # Mid-way through a length-prefixed binary frame
+                if len(buffer) < self._bin_remaining:
+                    break
+                payload = bytes(buffer[:self._bin_remaining])
+                del buffer[:self._bin_remaining]
+                events.append((self._bin_channel, payload, True))
+                self._bin_channel = None
+                continue
+
+            nl = buffer.find(b'\n')
+            if nl < 0:
+                break
+            line = bytes(buffer[:nl])
+            del buffer[:nl + 1]
+            if not line:
+                continue
+
+            if line[:_MSG_PREFIX_LEN] == _MSG_PREFIX:
+                rest = line[_MSG_PREFIX_LEN:]
+                sp = rest.find(b' ')
+                if sp >= 0:
+                    events.append((rest[:sp], rest[sp + 1:], False))
+                else:
+                    # Malformed message frame; surface it to the message
+                    # handler so the error is reported, not queued as a
+                    # command response
+                    events.append((rest, b'', False))
+            elif line[:_BIN_PREFIX_LEN] == _BIN_PREFIX:
+                rest = line[_BIN_PREFIX_LEN:]
+                sp = rest.find(b' ')
+                if sp >= 0:
+                    try:
+                        length = int(rest[sp + 1:])
+                    except ValueError:
+                        length = -1
+                    if length >= 0:
+                        self._bin_channel = rest[:sp]
+                        self._bin_remaining = length
+                    else:
+                        # Bad length field; same non-fatal error path as a
+                        # malformed Message frame
+                        events.append((rest[:sp], b'', False))
+                else:
+                    events.append((rest, b'', False))
+            else:
+                events.append((None, line, False))
+        return events